@@ -2,3 +2,18 @@ from . import models
 from .rest_framework import RESTCore
 from .session import RESTSession
 from .client import ZTE_Client
+from .transport import RecordTransport, ReplayTransport
+import importlib
+
+# Optional components, imported on first access to keep startup quick
+LAZY_ATTRIBUTES = {
+    'ReconnectWatchdog': 'watchdog',
+    'FleetFrame': 'fleet',
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{LAZY_ATTRIBUTES[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,209 @@
+from argparse import ArgumentParser, ArgumentTypeError
+from requests import RequestException
+from .client import ZTE_Client
+from .exceptions import AccessError, AuthFailure
+from .models import Connection, DATAUsage
+from .rest_framework import RESTCore
+from .session import RESTSession
+import json, os, sys, time
+
+
+MODELS = {
+    'connection': (Connection, 'CONNECTION_CMDS', 'CONNECTION_PROPERTIES'),
+    'datausage': (DATAUsage, 'DATA_USAGE_CMDS', 'DATA_USAGE_PROPERTIES'),
+}
+
+
+def _positive_float(value: str) -> float:
+    try:
+        result = float(value)
+    except ValueError:
+        raise ArgumentTypeError(f'{value!r} is not a number')
+    if result <= 0:
+        raise ArgumentTypeError(f'{value!r} must be greater than 0')
+    return result
+
+
+def _build_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog='pyzte5g', description='Query and control a ZTE 5G modem.')
+    parser.add_argument('--url', default=os.environ.get('PYZTE5G_URL', 'http://192.168.0.1/'),
+                        help='Modem base URL, defaults to $PYZTE5G_URL or http://192.168.0.1/.')
+    parser.add_argument('--password', default=os.environ.get('PYZTE5G_PASSWORD'),
+                        help='Modem admin password, defaults to $PYZTE5G_PASSWORD.')
+    parser.add_argument('--timeout', type=int, default=10, help='Request timeout, in seconds.')
+    parser.add_argument('--retries', type=int, default=5, help='Retries on request timeout.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    field_help = 'Raw cmd fields, model names (e.g. "connection") or model properties (e.g. "datausage.used_bytes").'
+    query = commands.add_parser('query', help='Print decoded fields once, as a JSON object.')
+    query.add_argument('fields', nargs='+', help=field_help)
+
+    watch = commands.add_parser('watch', help='Stream decoded fields as JSON lines.')
+    watch.add_argument('fields', nargs='+', help=field_help)
+    watch.add_argument('-i', '--interval', type=_positive_float, default=5, help='Seconds between queries.')
+    watch.add_argument('-n', '--count', type=int, default=0, help='Stop after this many lines, 0 runs forever.')
+
+    get = commands.add_parser('get', help='Raw "goform_get_cmd_process" passthrough.')
+    get.add_argument('cmd', nargs='+', help='Raw cmd fields to query.')
+
+    set_ = commands.add_parser('set', help='Raw "goform_set_cmd_process" passthrough.')
+    set_.add_argument('data', nargs='+', metavar='KEY=VALUE', help='Key value pairs to send.')
+    return parser
+
+
+def _resolve_fields(fields: list) -> tuple:
+    """
+        Split requested fields into raw cmd fields and model properties.
+
+        Arguments:
+            fields:
+                List of field strings passed on the command line.
+        Returns:
+            Tuple of (raw cmd fields, dictionary mapping model name to property names).
+        Raises:
+            ValueError: If a model property does not exist.
+    """
+    raw, selected = [], {}
+    for field in fields:
+        name, _, prop = field.partition('.')
+        if name not in MODELS:
+            raw.append(field)
+            continue
+        model, _, properties_attr = MODELS[name]
+        properties = getattr(model, properties_attr)
+        if prop and prop not in properties:
+            raise ValueError(f'"{prop}" is not a queryable property of {name}, choose from {properties}!')
+        selected.setdefault(name, [])
+        for value in ([prop] if prop else properties):
+            if value not in selected[name]:
+                selected[name].append(value)
+    return raw, selected
+
+
+class ResponseSession():
+    """
+        Serves a single merged modem response to model properties.
+        The session is probed for authentication at most once per response.
+    """
+
+    def __init__(self, session, response: dict) -> None:
+        self._session = session
+        self._response = response
+        self._is_authenticated = None
+
+    @property
+    def probed(self) -> bool:
+        return self._is_authenticated is not None
+
+    @property
+    def is_authenticated(self) -> bool:
+        if self._is_authenticated is None:
+            self._is_authenticated = self._session.is_authenticated
+        return self._is_authenticated
+
+    def get_cmd_process(self, cmd: tuple[str]) -> dict:
+        return self._response
+
+
+class FieldQuery():
+    """ Fetches raw cmd fields and model properties in a single merged modem query. """
+
+    def __init__(self, client, fields: list) -> None:
+        self._client = client
+        self._raw, self._selected = _resolve_fields(fields)
+        self._authenticate = False
+        cmd = list(self._raw)
+        for name in self._selected:
+            model, cmds_attr, _ = MODELS[name]
+            cmd.extend(getattr(model, cmds_attr))
+        self._cmd = tuple(dict.fromkeys(cmd))
+
+    @property
+    def cmd(self) -> tuple:
+        return self._cmd
+
+    def fetch(self) -> dict:
+        """
+            Query the modem once, bypassing the shared cache.
+
+            Model properties are evaluated against the merged response,
+            private properties are None while the session is not authenticated.
+            Session authentication is only checked when a private value is missing,
+            an expired session is renewed on the following query.
+
+            Returns:
+                Dictionary mapping each requested field to its value, None if unavailable.
+        """
+        response = self._client.session.fetch_cmd_process(cmd=self.cmd, authenticate=self._authenticate)
+        result = {field: response.get(field) for field in self._raw}
+        session = ResponseSession(session=self._client.session, response=response)
+        for name, properties in self._selected.items():
+            instance = MODELS[name][0](session=session)
+            for prop in properties:
+                try:
+                    result[f'{name}.{prop}'] = getattr(instance, prop)
+                except AccessError:
+                    result[f'{name}.{prop}'] = None
+        self._authenticate = session.probed and not session.is_authenticated
+        return result
+
+
+def _dump(data: dict):
+    sys.stdout.write(json.dumps(data, separators=(',', ':')) + '\n')
+    sys.stdout.flush()
+
+
+def _watch(query: FieldQuery, interval: float, count: int):
+    tick = 0
+    next_tick = time.monotonic()
+    while not count or tick < count:
+        line = {'ts': round(time.time(), 3)}
+        try:
+            line.update(query.fetch())
+        except Exception as e:
+            line['error'] = f'{type(e).__name__}: {e}'
+        _dump(line)
+        tick += 1
+        if count and tick >= count:
+            break
+        # Sleep until the next scheduled tick so request latency does not cause drift,
+        # skipping ticks missed during a stall rather than bursting to catch up
+        next_tick += interval
+        now = time.monotonic()
+        if next_tick < now:
+            next_tick += ((now - next_tick) // interval + 1) * interval
+        time.sleep(next_tick - now)
+
+
+def main(argv: list=None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        if args.password:
+            session = RESTSession(url=args.url, password=args.password, timeout=args.timeout, retries=args.retries)
+        else:
+            session = RESTCore(url=args.url, timeout=args.timeout, retries=args.retries)
+        client = ZTE_Client(url=args.url, session=session)
+
+        if args.command == 'get':
+            _dump(client.get_cmd_process(cmd=tuple(args.cmd)))
+        elif args.command == 'set':
+            invalid = [item for item in args.data if '=' not in item]
+            if invalid:
+                raise ValueError(f'{invalid} must be passed as KEY=VALUE!')
+            data = dict(item.split('=', 1) for item in args.data)
+            result = client.set_cmd_process(data=data)
+            _dump({'result': result})
+            return 0 if result else 1
+        elif args.command == 'query':
+            _dump(FieldQuery(client=client, fields=args.fields).fetch())
+        elif args.command == 'watch':
+            _watch(FieldQuery(client=client, fields=args.fields), interval=args.interval, count=args.count)
+    except KeyboardInterrupt:
+        pass
+    except (RequestException, AuthFailure) as e:
+        sys.stderr.write(f'pyzte5g: error: {type(e).__name__}: {e}\n')
+        return 1
+    except ValueError as e:
+        sys.stderr.write(f'pyzte5g: error: {e}\n')
+        return 2
+    return 0
@@ -6,17 +6,16 @@ from .models import DATAUsage, Connection
 class ZTE_Client():
     """ Client wrapper for the ZTE device REST API. """
 
-    def __init__(self, url: str, password: str=None, session: RESTSession=None) -> None:
+    def __init__(self, url: str, password: str=None, session: RESTSession=None, transport=None, cache_ttl: float=None) -> None:
         if session:
             self._session = session
         elif password:
-            self._session = RESTSession(url=url, password=password)
+            self._session = RESTSession(url=url, password=password, transport=transport)
         else:
-            self._session = RESTCore(url=url)
-        self._datausage_session = self._session
-        self._connection_session = self._session
-        self._datausage = DATAUsage(session=self._session)
-        self._connection = Connection(session=self._session)
+            self._session = RESTCore(url=url, transport=transport)
+        self._cache_ttl = cache_ttl
+        self._datausage = DATAUsage(session=self._session, cache_ttl=cache_ttl)
+        self._connection = Connection(session=self._session, cache_ttl=cache_ttl)
 
     @property
     def session(self):
@@ -24,7 +23,24 @@ class ZTE_Client():
 
     @session.setter
     def session(self, value):
+        if value is self._session:
+            return
+        # Release cached responses tied to the previous session
+        self._datausage.clear_cache()
+        self._connection.clear_cache()
+        if isinstance(self._session, RESTCore):
+            self._session.clear_cmd_cache()
         self._session = value
+        self._datausage = DATAUsage(session=value, cache_ttl=self._cache_ttl)
+        self._connection = Connection(session=value, cache_ttl=self._cache_ttl)
+
+    @property
+    def cache_ttl(self) -> float:
+        """
+            Numeric: Seconds model responses are cached for,
+                     None uses each model's default.
+        """
+        return self._cache_ttl
 
     @property
     def datausage(self):
@@ -32,9 +48,6 @@ class ZTE_Client():
             Access data usage metrics from the ZTE modem API.
             Public endpoint, does not require an authenticated session.
         """
-        if self._datausage_session != self.session:
-            self._datausage_session = self.session
-            self._datausage = DATAUsage(session=self.session)
         return self._datausage
 
     @property
@@ -43,9 +56,6 @@ class ZTE_Client():
             Access connection details from the ZTE modem API.
             Private endpoint, most properties require an authenticated session.
         """
-        if self._connection_session != self.session:
-            self._connection_session = self.session
-            self._connection = Connection(session=self.session)
         return self._connection
 
     def get_cmd_process(self, cmd: tuple[str]) -> dict:
@@ -6,3 +6,6 @@ class AccessError(AuthFailure):
         Attempt to access a private value from the ZTE modem API
         while session is not currently authenticated.
     """
+
+class ReplayError(Exception):
+    """ Replay transport has no recorded response matching a request. """
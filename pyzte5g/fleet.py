@@ -0,0 +1,380 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress
+from operator import and_, itemgetter
+from .models import Connection, DATAUsage
+import heapq, statistics, time
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """ Import numpy on first use, keeping it out of package startup. Returns None when not installed. """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class FleetFrame():
+    """
+        Columnar container of decoded metrics collected from many ZTE modems.
+
+        Each decoded field is stored as a typed array (a list for string fields)
+        holding one row per modem, alongside a mask marking which rows hold a value.
+        When numpy is installed, statistics run as vectorized numpy operations on
+        zero-copy views of the column buffers. Without it they fall back to the
+        standard library, which still iterates per element.
+    """
+
+    FLEET_CMDS = tuple(dict.fromkeys(Connection.CONNECTION_CMDS + DATAUsage.DATA_USAGE_CMDS))
+    FLEET_VAL_MAP = tuple(
+        (key, instance) for key, _, instance in Connection.CONNECTION_VAL_MAP + DATAUsage.DATA_USAGE_VAL_MAP
+    )
+    TYPECODES = {
+        int: 'q',
+        float: 'd',
+        bool: 'b',
+    }
+    AGGREGATES = {
+        'count': len,
+        'sum': sum,
+        'min': min,
+        'max': max,
+        'mean': statistics.fmean,
+        'median': statistics.median,
+    }
+
+    def __init__(self, fields: tuple=FLEET_VAL_MAP) -> None:
+        self._fields = dict(fields)
+        self._ids = []
+        self._timestamps = array('d')
+        self._columns = {key: self._new_column(instance) for key, instance in self._fields.items()}
+        self._masks = {key: bytearray() for key in self._fields}
+        self._errors = {}
+        # One element arrays checking values against a typecode before any column is changed
+        self._probes = {typecode: array(typecode, (0,)) for typecode in self.TYPECODES.values()}
+
+    def _new_column(self, instance):
+        typecode = self.TYPECODES.get(instance)
+        return array(typecode) if typecode else []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> list:
+        return self._ids
+
+    @property
+    def timestamps(self) -> array:
+        return self._timestamps
+
+    @property
+    def fields(self) -> tuple:
+        return tuple(self._fields)
+
+    @property
+    def errors(self) -> dict:
+        """ Dictionary: Exceptions raised while collecting, keyed by modem identifier. """
+        return self._errors
+
+    def column(self, name: str):
+        """ Array of every row's value for a field, missing rows hold a placeholder. """
+        return self._columns[name]
+
+    def mask(self, name: str) -> bytearray:
+        """ Bytearray marking rows holding a value for a field with 1, missing rows with 0. """
+        return self._masks[name]
+
+    def append(self, modem_id, record: dict, timestamp: float=None):
+        """
+            Add one modem's decoded metrics as a new row.
+
+            Every value is checked before any column is changed,
+            so a rejected record leaves the frame untouched.
+
+            Arguments:
+                modem_id:
+                    Hashable identifier for the modem, e.g. its URL.
+                record:
+                    Dictionary of decoded values, e.g. from "get_connection".
+                timestamp:
+                    Unix time the values were collected, defaults to now.
+            Raises:
+                TypeError: If a value does not fit its field's type.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        self._check(self._timestamps, 'timestamp', timestamp)
+        row = []
+        for key, instance in self._fields.items():
+            value = record.get(key)
+            present = value is not None
+            if present:
+                self._check(self._columns[key], key, value)
+            row.append((key, value if present else self._placeholder(instance), present))
+
+        self._ids.append(modem_id)
+        self._timestamps.append(timestamp)
+        for key, value, present in row:
+            self._columns[key].append(value)
+            self._masks[key].append(present)
+
+    def _check(self, column, key: str, value):
+        """ Raise TypeError when a value can not be stored in a typed column. """
+        if not isinstance(column, array):
+            return
+        try:
+            self._probes[column.typecode][0] = value
+        except (TypeError, OverflowError) as e:
+            raise TypeError(f'Invalid value {value!r} for field "{key}": {e}') from e
+
+    def _placeholder(self, instance):
+        return instance() if instance in self.TYPECODES else None
+
+    @classmethod
+    def from_records(cls, records: dict, timestamp: float=None, fields: tuple=FLEET_VAL_MAP):
+        """
+            Build a frame from decoded per-modem dictionaries.
+
+            Arguments:
+                records:
+                    Dictionary mapping modem identifier to decoded values.
+                timestamp:
+                    Unix time the values were collected, defaults to now.
+                fields:
+                    Tuple of (key, type) pairs to store as columns.
+            Returns:
+                FleetFrame containing one row per modem.
+        """
+        frame = cls(fields=fields)
+        for modem_id, record in records.items():
+            frame.append(modem_id=modem_id, record=record, timestamp=timestamp)
+        return frame
+
+    @classmethod
+    def collect(cls, clients: dict, workers: int=8):
+        """
+            Sweep a fleet of modems, one merged query per modem.
+
+            Modems failing to respond are kept as rows with every value missing,
+            the raised exceptions are available from "errors".
+
+            Arguments:
+                clients:
+                    Dictionary mapping modem identifier to "ZTE_Client".
+                workers:
+                    Number of modems queried concurrently.
+            Returns:
+                FleetFrame containing one row per modem.
+        """
+        def sweep(client):
+            try:
+                response = client.get_cmd_process(cmd=cls.FLEET_CMDS)
+            except Exception as e:
+                return {}, time.time(), e
+            record = client.connection.decode_connection(response=response)
+            record.update(client.datausage.decode_data_usage(response=response))
+            return record, time.time(), None
+
+        frame = cls()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(sweep, clients.values())
+            for modem_id, (record, timestamp, error) in zip(clients, results):
+                frame.append(modem_id=modem_id, record=record, timestamp=timestamp)
+                if error is not None:
+                    frame.errors[modem_id] = error
+        return frame
+
+    def _column_array(self, name: str):
+        """ Numpy view of a column, sharing the typed array's buffer. """
+        numpy = _numpy()
+        column = self._columns[name]
+        if isinstance(column, array):
+            return numpy.frombuffer(column, dtype=column.typecode)
+        return numpy.array(column, dtype=object)
+
+    def _mask_array(self, name: str):
+        """ Numpy boolean view of a column mask. """
+        numpy = _numpy()
+        return numpy.frombuffer(self._masks[name], dtype=numpy.bool_)
+
+    def _present(self, name: str):
+        """ Present values for a field, as a numpy array when available, otherwise a list. """
+        if _numpy() is None:
+            return list(compress(self._columns[name], self._masks[name]))
+        return self._column_array(name)[self._mask_array(name)]
+
+    def _aggregate_func(self, func: str):
+        aggregate = self.AGGREGATES[func]
+        if _numpy() is None or func == 'count':
+            return aggregate
+        return getattr(_numpy(), func)
+
+    @staticmethod
+    def _scalar(value):
+        return value.item() if hasattr(value, 'item') else value
+
+    def values(self, name: str) -> list:
+        """ List of present values for a field, missing rows dropped. """
+        values = self._present(name)
+        return values if _numpy() is None else values.tolist()
+
+    def aggregate(self, name: str, funcs: tuple=('count', 'min', 'max', 'mean', 'median')) -> dict:
+        """
+            Summarise a field across the fleet.
+
+            Arguments:
+                name:
+                    Field to summarise, e.g. "sig_strength_5g".
+                funcs:
+                    Tuple of aggregate names, see "AGGREGATES".
+            Returns:
+                Dictionary mapping aggregate name to value, None when no values are present.
+        """
+        values = self._present(name)
+        return {
+            func: (self._scalar(self._aggregate_func(func)(values)) if len(values) or func == 'count' else None)
+            for func in funcs
+        }
+
+    def percentiles(self, name: str, q: tuple=(50, 90, 99)) -> dict:
+        """
+            Percentiles of a field across the fleet, linearly interpolated between values.
+
+            Arguments:
+                name:
+                    Field to summarise, e.g. "used_bytes".
+                q:
+                    Tuple of percentiles between 0 and 100, e.g. (50, 99.9).
+            Returns:
+                Dictionary mapping percentile to value, None when no values are present.
+            Raises:
+                ValueError: If a percentile is outside 0 to 100.
+        """
+        for p in q:
+            if not 0 <= p <= 100:
+                raise ValueError(f'Percentile {p} must be between 0 and 100!')
+        numpy = _numpy()
+        values = self._present(name)
+        if not len(values):
+            return {p: None for p in q}
+        if numpy is not None:
+            return dict(zip(q, numpy.percentile(values, q).tolist()))
+
+        values = sorted(values)
+        result = {}
+        for p in q:
+            position = p / 100 * (len(values) - 1)
+            lower = int(position)
+            upper = min(lower + 1, len(values) - 1)
+            result[p] = float(values[lower] + (values[upper] - values[lower]) * (position - lower))
+        return result
+
+    def group_by(self, key: str, name: str, func: str='mean') -> dict:
+        """
+            Aggregate a field for each distinct value of another field.
+
+            Arguments:
+                key:
+                    Field to group rows by, e.g. "state".
+                name:
+                    Field to aggregate, e.g. "sig_strength_lte".
+                func:
+                    Aggregate name, see "AGGREGATES".
+            Returns:
+                Dictionary mapping group value to aggregated value.
+        """
+        numpy = _numpy()
+        aggregate = self._aggregate_func(func)
+        if numpy is None:
+            present = bytes(map(and_, self._masks[key], self._masks[name]))
+            groups = {}
+            for group, value in zip(compress(self._columns[key], present), compress(self._columns[name], present)):
+                groups.setdefault(group, []).append(value)
+            return {group: aggregate(values) for group, values in groups.items()}
+
+        present = self._mask_array(key) & self._mask_array(name)
+        keys = self._column_array(key)[present]
+        if keys.dtype == object:
+            # Fixed width strings sort in C, unlike Python objects
+            keys = keys.astype(str)
+        values = self._column_array(name)[present]
+        groups, inverse = numpy.unique(keys, return_inverse=True)
+        inverse = inverse.ravel()
+        # Sort values by group once, then split into one contiguous segment per group
+        segments = numpy.split(values[numpy.argsort(inverse, kind='stable')], numpy.cumsum(numpy.bincount(inverse))[:-1])
+        return {self._scalar(group): self._scalar(aggregate(segment)) for group, segment in zip(groups, segments)}
+
+    def top_k(self, name: str, k: int=10, largest: bool=True) -> list:
+        """
+            Modems with the highest (or lowest) values for a field.
+
+            Arguments:
+                name:
+                    Field to rank, e.g. "sig_strength_5g".
+                k:
+                    Number of modems to return.
+                largest:
+                    Boolean, False returns the lowest values, e.g. worst signal strength.
+            Returns:
+                List of (modem identifier, value) tuples, ordered best match first,
+                equal values in row order.
+        """
+        numpy = _numpy()
+        if numpy is None:
+            mask = self._masks[name]
+            rows = zip(compress(self._ids, mask), compress(self._columns[name], mask))
+            select = heapq.nlargest if largest else heapq.nsmallest
+            return select(k, rows, key=itemgetter(1))
+
+        rows = numpy.flatnonzero(self._mask_array(name))
+        values = self._column_array(name)[rows]
+        k = min(k, len(values))
+        if k <= 0:
+            return []
+        # Partition to find the k-th value, then only sort the rows reaching it
+        if largest:
+            threshold = numpy.partition(values, len(values) - k)[len(values) - k]
+            candidates = numpy.flatnonzero(values >= threshold)
+            # Stable descending sort, reversing twice keeps equal values in row order
+            order = len(candidates) - 1 - numpy.argsort(values[candidates][::-1], kind='stable')[::-1]
+        else:
+            threshold = numpy.partition(values, k - 1)[k - 1]
+            candidates = numpy.flatnonzero(values <= threshold)
+            order = numpy.argsort(values[candidates], kind='stable')
+        selected = candidates[order[:k]]
+        return [(self._ids[rows[i]], self._scalar(values[i])) for i in selected]
+
+    def rate(self, previous, name: str, per: float=86400):
+        """
+            Rate of change of a field between two sweeps of the same fleet.
+
+            e.g. "frame.rate(previous=yesterday, name='used_bytes')" gives the data burn rate, in bytes per day.
+
+            Arguments:
+                previous:
+                    Earlier FleetFrame covering the same modems.
+                name:
+                    Numeric field to compare, e.g. "used_bytes".
+                per:
+                    Length of the reported rate period, in seconds.
+            Returns:
+                FleetFrame with a single "<name>_rate" column, one row per modem present in both sweeps.
+        """
+        rate_name = f'{name}_rate'
+        frame = FleetFrame(fields=((rate_name, float),))
+        earlier = {
+            modem_id: (value, timestamp)
+            for modem_id, value, timestamp in compress(
+                zip(previous.ids, previous.column(name), previous.timestamps), previous.mask(name)
+            )
+        }
+        for modem_id, value, timestamp in compress(zip(self._ids, self._columns[name], self._timestamps), self._masks[name]):
+            if modem_id not in earlier:
+                continue
+            prev_value, prev_timestamp = earlier[modem_id]
+            elapsed = timestamp - prev_timestamp
+            record = {rate_name: (value - prev_value) * per / elapsed} if elapsed > 0 else {}
+            frame.append(modem_id=modem_id, record=record, timestamp=timestamp)
+        return frame
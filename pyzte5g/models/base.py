@@ -1,12 +1,53 @@
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from functools import wraps
+from threading import RLock
 from ..exceptions import AccessError
 import math
 
 
+def cached_response(method):
+    """
+        Cache a model query method in the instance's TTL cache.
+
+        Unlike "cachetools.cachedmethod" the instance lock is held while the
+        ZTE modem API is queried, so concurrent cache misses are answered by a
+        single request instead of each thread querying the modem.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = hashkey(method.__name__, *args, **kwargs)
+        with self._cache_lock:
+            try:
+                return self._cache[key]
+            except KeyError:
+                pass
+            result = method(self, *args, **kwargs)
+            self._cache[key] = result
+            return result
+    return wrapper
+
+
 class Base():
     """ Base model class. """
 
-    def __init__(self, session) -> None:
+    CACHE_TTL = 5
+    CACHE_MAXSIZE = 8
+
+    def __init__(self, session, cache_ttl: float=None) -> None:
         self._session = session
+        self._cache_ttl = self.CACHE_TTL if cache_ttl is None else cache_ttl
+        self._cache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self._cache_ttl)
+        self._cache_lock = RLock()
+
+    @property
+    def cache_ttl(self) -> float:
+        return self._cache_ttl
+
+    def clear_cache(self):
+        """ Drop all cached responses held by this model instance. """
+        with self._cache_lock:
+            self._cache.clear()
 
     def _can_cast(self, val, instance):
         try:
@@ -1,10 +1,17 @@
-from cachetools import cached, LRUCache
-from .base import Base
+from .base import Base, cached_response
+import time
 
 
 class Connection(Base):
     """ Implements methods to fetch ZTE modem connection information. """
 
+    CACHE_TTL = 1
+    CONNECTED_STATE = 'ipv4_ipv6_connected'
+    DISCONNECTED_STATE = 'ppp_disconnected'
+    CONNECTING_STATE = 'ppp_connecting'
+    STATE_CMDS = (
+        'ppp_status',
+    )
     CONNECTION_CMDS = (
         'ppp_status',
         'lte_rsrp',
@@ -19,6 +26,18 @@ class Connection(Base):
         ('wan_ipv4_addr', 'wan_ipaddr', str),
         ('wan_ipv6_addr', 'ipv6_wan_ipaddr', str),
     )
+    CONNECTION_PROPERTIES = (
+        'state',
+        'is_connected',
+        'sig_strength_lte',
+        'sig_strength_5g',
+        'wan_ipv4_addr',
+        'wan_ipv6_addr',
+    )
+
+    def __init__(self, session, cache_ttl: float=None) -> None:
+        super().__init__(session=session, cache_ttl=cache_ttl)
+        self._transition_time = None
 
     @property
     def state(self) -> str:
@@ -30,7 +49,15 @@ class Connection(Base):
 
     @property
     def is_connected(self) -> bool:
-        return self.state == 'ipv4_ipv6_connected' or self.state not in ('ppp_disconnected', 'ppp_connecting')
+        return self.state == self.CONNECTED_STATE or self.state not in (self.DISCONNECTED_STATE, self.CONNECTING_STATE)
+
+    @property
+    def transition_time(self) -> float:
+        """
+            Numeric: Seconds taken to reach the target state during the last
+                     waited connect/disconnect, None if it was not reached.
+        """
+        return self._transition_time
 
     @property
     def sig_strength_lte(self) -> int:
@@ -74,6 +101,7 @@ class Connection(Base):
         """
         return self._try_get_private(data=self.get_connection(), key='wan_ipv4_addr')
 
+    @cached_response
     def get_connection(self) -> dict:
         """
             Queries connection details from the ZTE modem API.
@@ -82,20 +110,108 @@ class Connection(Base):
                 Dictionary Containing connection details.
         """
         response = self._session.get_cmd_process(cmd=self.CONNECTION_CMDS)
+        return self.decode_connection(response=response)
+
+    def decode_connection(self, response: dict) -> dict:
+        """
+            Decode connection details from a raw ZTE modem API response.
+
+            Arguments:
+                response:
+                    Dictionary containing raw device values, e.g. from "get_cmd_process".
+            Returns:
+                Dictionary Containing connection details.
+        """
         return self._cast_data_to_map(data=response, map=self.CONNECTION_VAL_MAP)
 
-    def disconnect(self) -> bool:
-        """ Disable the WAN connection. """
-        return self._session.set_cmd_process(data={
+    def poll_state(self) -> str:
+        """
+            Queries only the WAN connection state, bypassing the shared cache
+            and skipping session authentication checks.
+
+            Returns:
+                String containing the current connection state.
+        """
+        response = self._session.fetch_cmd_process(cmd=self.STATE_CMDS, authenticate=False)
+        return response.get('ppp_status', '')
+
+    def wait_for_state(self, state: str, timeout: float=60, poll_min: float=0.1, poll_max: float=2, backoff: float=1.5) -> float:
+        """
+            Block until the WAN connection reaches the target state.
+
+            The state is polled on an adaptive interval, starting at "poll_min"
+            and multiplied by "backoff" after each poll, up to "poll_max".
+
+            Arguments:
+                state:
+                    Target connection state, e.g. "ipv4_ipv6_connected".
+                timeout:
+                    Maximum number of seconds to wait.
+                poll_min:
+                    Initial polling interval, in seconds.
+                poll_max:
+                    Maximum polling interval, in seconds.
+                backoff:
+                    Multiplier applied to the polling interval after each poll.
+            Returns:
+                Seconds taken to reach the target state, None on timeout.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        interval = poll_min
+        while True:
+            if self.poll_state() == state:
+                return time.monotonic() - start
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(interval, remaining))
+            interval = min(interval * backoff, poll_max)
+
+    def disconnect(self, wait: bool=False, timeout: float=60) -> bool:
+        """
+            Disable the WAN connection.
+
+            Arguments:
+                wait:
+                    Boolean, if True block until the connection is disconnected.
+                timeout:
+                    Maximum number of seconds to wait.
+            Returns:
+                Boolean, True if request succeeded and, when waiting, the target state was reached.
+        """
+        result = self._session.set_cmd_process(data={
             'isTest': False,
             'notCallback': True,
             'goformId': 'DISCONNECT_NETWORK',
         })
+        self.clear_cache()
+        if result and wait:
+            self._transition_time = self.wait_for_state(state=self.DISCONNECTED_STATE, timeout=timeout)
+            self.clear_cache()
+            return self._transition_time is not None
+        return result
 
-    def connect(self) -> bool:
-        """ Enable the WAN connection. """
-        return self._session.set_cmd_process(data={
+    def connect(self, wait: bool=False, timeout: float=60) -> bool:
+        """
+            Enable the WAN connection.
+
+            Arguments:
+                wait:
+                    Boolean, if True block until the connection is established.
+                timeout:
+                    Maximum number of seconds to wait.
+            Returns:
+                Boolean, True if request succeeded and, when waiting, the target state was reached.
+        """
+        result = self._session.set_cmd_process(data={
             'isTest': False,
             'notCallback': True,
             'goformId': 'CONNECT_NETWORK',
         })
+        self.clear_cache()
+        if result and wait:
+            self._transition_time = self.wait_for_state(state=self.CONNECTED_STATE, timeout=timeout)
+            self.clear_cache()
+            return self._transition_time is not None
+        return result
@@ -1,6 +1,5 @@
 from urllib.parse import urlencode
-from cachetools import cached, TTLCache
-from .base import Base
+from .base import Base, cached_response
 
 
 class DATAUsage(Base):
@@ -29,6 +28,18 @@ class DATAUsage(Base):
         ('remaining_days', 'datausage_remaindays', int),
         ('usage_warning', 'datausage_lowbalance', bool),
     )
+    DATA_USAGE_PROPERTIES = (
+        'used_bytes',
+        'remaining_bytes',
+        'used_percent',
+        'remaining_percent',
+        'total_bytes',
+        'remaining_days',
+        'used_data',
+        'remaining_data',
+        'total_data',
+        'usage_warning',
+    )
 
     @property
     def used_bytes(self) -> int:
@@ -80,7 +91,7 @@ class DATAUsage(Base):
         """ Boolean: True if data usage warning has been reached. """
         return self.get_data_usage().get('usage_warning', False)
 
-    @cached(cache=TTLCache(maxsize=16, ttl=5))
+    @cached_response
     def get_data_usage(self) -> dict:
         """
             Queries data usage metrics from the ZTE modem API.
@@ -90,6 +101,18 @@ class DATAUsage(Base):
         """
 
         response = self._session.get_cmd_process(cmd=self.DATA_USAGE_CMDS)
+        return self.decode_data_usage(response=response)
+
+    def decode_data_usage(self, response: dict) -> dict:
+        """
+            Decode data usage metrics from a raw ZTE modem API response.
+
+            Arguments:
+                response:
+                    Dictionary containing raw device values, e.g. from "get_cmd_process".
+            Returns:
+                Dictionary Containing data usage metrics.
+        """
         result = self._cast_data_to_map(data=response, map=self.DATA_USAGE_VAL_MAP)
         for source, key in [('used_bytes', 'used_data'), ('remaining_bytes', 'remaining_data'), ('total_bytes', 'total_data')]:
             if result.get(source):
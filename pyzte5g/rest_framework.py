@@ -1,5 +1,5 @@
 from typing import Literal
-from cachetools import cached, LRUCache, TTLCache
+from cachetools import cached, TTLCache
 from urllib.parse import urlparse, urlunparse, urlunsplit, urlencode
 from requests import Timeout
 from threading import Lock
@@ -14,7 +14,7 @@ class RESTCore():
     GET_PROCESS_ENDPOINT = 'goform/goform_get_cmd_process'
     SET_PROCESS_ENDPOINT = 'goform/goform_set_cmd_process'
 
-    def __init__(self, url: str, timeout: int=10, retries: int=5) -> None:
+    def __init__(self, url: str, timeout: int=10, retries: int=5, transport=None) -> None:
         self._url = urlparse(url)
         if self._url.path != '/':
             url = urlunsplit(self._url[0:2] + ('/',) + self._url[3:5])
@@ -22,6 +22,7 @@ class RESTCore():
         self._baseurl = urlunparse(self._url)
         self._timeout = timeout
         self._retries = retries
+        self._transport = transport
         self._headers = {
             'Referer': f'{self.baseurl}index.html',
             'Accept': 'application/json, text/javascript, */*; q=0.01',
@@ -59,6 +60,14 @@ class RESTCore():
     def retries(self, value):
         self._retries = value
 
+    @property
+    def transport(self):
+        return self._transport
+
+    @transport.setter
+    def transport(self, value):
+        self._transport = value
+
     @property
     def headers(self) -> dict:
         return self._headers
@@ -67,7 +76,6 @@ class RESTCore():
     def headers(self, value):
         self._headers = value
 
-    @cached(cache=LRUCache(maxsize=32))
     def _build_cmd_url(self, path: str, query: str='') -> str:
         """
             Build URL for use in REST requests to the modem API.
@@ -90,7 +98,14 @@ class RESTCore():
     def _method_request_post(self):
         return requests.post
 
-    def _make_request(self, url: str, method: Literal['GET', 'POST']='GET', data: dict={}, remain_retries: int=0) -> dict:
+    def _request_method(self, method: Literal['GET', 'POST']):
+        """ Resolve request method, routed through the transport when one is set. """
+        req_method = getattr(self, f'_method_request_{method.lower()}')()
+        if self.transport:
+            req_method = self.transport.wrap(method=method, func=req_method)
+        return req_method
+
+    def _make_request(self, url: str, method: Literal['GET', 'POST']='GET', data: dict={}, remain_retries: int=0, authenticate: bool=True) -> dict:
         """
             Execute REST request to ZTE modem API.
 
@@ -103,6 +118,8 @@ class RESTCore():
                     If method is "POST" this is the data packet that will be sent in the API request.
                 remain_retries:
                     Integer specifying number of tries before failing on timeout.
+                authenticate:
+                    Boolean, if False skip session authentication checks on success.
             Returns:
                 Dictionary Containing device values on "GET" and success or failure on "POST".
             Raises:
@@ -120,7 +137,7 @@ class RESTCore():
             raise TypeError(f'"remain_retries" object must be passed as an integer, not {type(url)}!')
 
         response = {}
-        req_method = getattr(self, f'_method_request_{method.lower()}')()
+        req_method = self._request_method(method=method)
         try:
             api_request = req_method(
                 url=url,
@@ -139,9 +156,17 @@ class RESTCore():
         except Exception as e:
             raise e
         if remain_retries and remain_retries >= 1:
-            response = self._make_request(url=url, method=method, data=data, remain_retries=remain_retries)
+            response = self._make_request(url=url, method=method, data=data, remain_retries=remain_retries, authenticate=authenticate)
         return response
 
+    def clear_cmd_cache(self):
+        """ Drop this session's entries from the shared state cache. """
+        with self.GET_PROCESS_LOCK:
+            # Expired entries are not iterable but still hold a reference until removed
+            self.GET_PROCESS_CACHE.expire()
+            for key in [key for key in self.GET_PROCESS_CACHE if key[0] is self]:
+                self.GET_PROCESS_CACHE.pop(key, None)
+
     @cached(cache=GET_PROCESS_CACHE, lock=GET_PROCESS_LOCK)
     def get_cmd_process(self, cmd: tuple[str]) -> dict:
         """
@@ -155,6 +180,24 @@ class RESTCore():
             Raises:
                 TypeError: If passed "cmd" is not tuple.
         """
+        return self.fetch_cmd_process(cmd=cmd)
+
+    def fetch_cmd_process(self, cmd: tuple[str], authenticate: bool=True) -> dict:
+        """
+            Query ZTE modem state using provided parameters, bypassing the shared cache.
+
+            Arguments:
+                cmd:
+                    Tuple of strings, used to query the device state.
+                authenticate:
+                    Boolean, if False skip session authentication checks,
+                    only re-authenticating when the response holds no values.
+                    Use for public values polled at a high rate.
+            Returns:
+                Dictionary Containing device values for queried parameters.
+            Raises:
+                TypeError: If passed "cmd" is not tuple.
+        """
 
         if not isinstance(cmd, tuple):
             raise TypeError(f'"cmd" object must be tuple, not {type(cmd)}!')
@@ -168,7 +211,8 @@ class RESTCore():
         )
         return self._make_request(
             url=self._build_cmd_url(path=self.GET_PROCESS_ENDPOINT, query=query),
-            method='GET'
+            method='GET',
+            authenticate=authenticate,
         )
 
     def set_cmd_process(self, data: dict) -> bool:
@@ -2,6 +2,7 @@ from selenium.webdriver import Firefox
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from .rest_framework import RESTCore
+from .transport import ReplayTransport
 import time, json
 
 
@@ -10,10 +11,11 @@ class RESTSelenium(RESTCore):
     Uses Selenium to integrate with the ZTE Modem REST API.
 
     This implementation is a hack to get arround issues when attempting to use the requests module to set command states.
+    While a "ReplayTransport" is attached, command states are set through the transport instead.
     """
 
-    def __init__(self, url: str, timeout: int=10, retries: int=5, webdriver: RemoteWebDriver=Firefox, options=None, executable_path: str='geckodriver') -> None:
-        super().__init__(url=url, timeout=timeout, retries=retries)
+    def __init__(self, url: str, timeout: int=10, retries: int=5, transport=None, webdriver: RemoteWebDriver=Firefox, options=None, executable_path: str='geckodriver') -> None:
+        super().__init__(url=url, timeout=timeout, retries=retries, transport=transport)
         self._password = None
         self._webdriver = webdriver
         self._executable_path = executable_path
@@ -62,6 +64,9 @@ class RESTSelenium(RESTCore):
 
         if not isinstance(data, dict):
             raise TypeError(f'"data" object must be a dictionary, not {type(data)}!')
+        if isinstance(self.transport, ReplayTransport):
+            # Never drive a real browser against the recorded modem while replaying
+            return super().set_cmd_process(data=data)
 
         url = self._build_cmd_url(path=self.SET_PROCESS_ENDPOINT)
         driver = self.webdriver(options=self.options, executable_path=self.executable_path)
@@ -8,8 +8,8 @@ import requests, base64, hashlib
 class RESTSession(RESTSelenium):
     """ Extends core framework to include request session management and authentication. """
 
-    def __init__(self, url: str, password: str, timeout: int=10, retries: int=5) -> None:
-        super().__init__(url=url, timeout=timeout, retries=retries)
+    def __init__(self, url: str, password: str, timeout: int=10, retries: int=5, transport=None) -> None:
+        super().__init__(url=url, timeout=timeout, retries=retries, transport=transport)
         self._session = requests.Session()
         self._password = password and base64.b64encode(
             password.encode('utf-8')
@@ -40,7 +40,7 @@ class RESTSession(RESTSelenium):
                 multi_data=1,
             )
         )
-        req_method = self._method_request_get()
+        req_method = self._request_method(method='GET')
         try:
             api_request = req_method(
                 url=self._build_cmd_url(path=self.GET_PROCESS_ENDPOINT, query=query),
@@ -60,7 +60,7 @@ class RESTSession(RESTSelenium):
 
     def _renew_auth(self):
         with self.GET_PROCESS_LOCK:
-            req_method = self._method_request_post()
+            req_method = self._request_method(method='POST')
             req_method(
                 url=self._build_cmd_url(path=self.SET_PROCESS_ENDPOINT),
                 timeout=self.timeout,
@@ -81,16 +81,21 @@ class RESTSession(RESTSelenium):
     def manage_auth(func=None):
         """ Decorator to manage the request session. """
         def auth_dec(self, **kwargs):
-            if self._password and not self.is_authenticated:
+            if kwargs.get('authenticate', True) and self._password and not self.is_authenticated:
                 self._renew_auth()
             return func(self, **kwargs)
         return auth_dec
 
     @manage_auth
-    def _make_request(self, url: str, method: Literal['GET', 'POST']='GET', data: dict={}, remain_retries: int=0) -> dict:
-        result = super()._make_request(url=url, method=method, data=data, remain_retries=remain_retries)
-        if not (result and self.is_authenticated):
+    def _make_request(self, url: str, method: Literal['GET', 'POST']='GET', data: dict={}, remain_retries: int=0, authenticate: bool=True) -> dict:
+        result = super()._make_request(url=url, method=method, data=data, remain_retries=remain_retries, authenticate=authenticate)
+        if authenticate:
+            expired = not (result and self.is_authenticated)
+        else:
+            # Skip the auth probe, only treat a response without any values as expired
+            expired = not any(result.values())
+        if expired:
             # Authed session has timed out, re-auth and try again
             self._renew_auth()
-            result = super()._make_request(url=url, method=method, data=data, remain_retries=remain_retries)
+            result = super()._make_request(url=url, method=method, data=data, remain_retries=remain_retries, authenticate=authenticate)
         return result
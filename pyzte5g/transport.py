@@ -0,0 +1,200 @@
+from collections import defaultdict, deque
+from urllib.parse import urlparse, parse_qs
+from requests import exceptions, Timeout
+from threading import Lock
+from .exceptions import ReplayError
+import json, gzip, time
+
+
+def _request_key(method: str, url: str, data: dict=None) -> str:
+    """
+        Build a stable key identifying a ZTE modem API request.
+
+        Volatile values (timestamps, passwords, auth tokens) are dropped,
+        only the endpoint, queried "cmd" fields and "goformId" are kept.
+
+        Arguments:
+            method:
+                Request method, either "GET" or "POST".
+            url:
+                URL string pointing to REST endpoint.
+            data:
+                If method is "POST" this is the data packet sent in the API request.
+        Returns:
+            Formatted key string, e.g. "GET goform/goform_get_cmd_process?cmd=ppp_status".
+    """
+    parsed = urlparse(url)
+    key = f'{method} {parsed.path.lstrip("/")}'
+    cmd = parse_qs(parsed.query).get('cmd')
+    if cmd:
+        key += f'?cmd={cmd[0]}'
+    if data and data.get('goformId'):
+        key += f'#{data["goformId"]}'
+    return key
+
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, f'{mode}t', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class ReplayResponse():
+    """ Minimal stand-in for "requests.Response" returned by the replay transport. """
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    @property
+    def status_code(self) -> int:
+        return 200
+
+    def json(self) -> dict:
+        return self._payload
+
+
+class RecordTransport():
+    """
+        Records every ZTE modem API request/response pair with timing.
+
+        Each exchange is written as a single compact JSON line containing
+        the offset from the start of the recording "t", request key "k",
+        round trip time "d" (both in seconds) and either the decoded response "r"
+        or the raised exception's class name "e". Paths ending in ".gz" are gzip compressed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file = _open(path, 'w')
+        self._lock = Lock()
+        self._start = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def _write(self, entry: dict):
+        line = json.dumps(entry, separators=(',', ':'))
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def wrap(self, method: str, func):
+        """
+            Wrap a request method so its exchanges are recorded.
+
+            Arguments:
+                method:
+                    Request method being wrapped, either "GET" or "POST".
+                func:
+                    Request callable, e.g. "requests.get".
+            Returns:
+                Callable with the same signature as "func".
+        """
+        def record(url: str, data: dict=None, **kwargs):
+            entry = dict(
+                t=round(time.monotonic() - self._start, 6),
+                k=_request_key(method=method, url=url, data=data),
+            )
+            start = time.perf_counter()
+            try:
+                response = func(url=url, data=data, **kwargs)
+                payload = response.json()
+            except Exception as e:
+                entry.update(d=round(time.perf_counter() - start, 6), e=type(e).__name__)
+                self._write(entry)
+                raise e
+            entry.update(d=round(time.perf_counter() - start, 6), r=payload)
+            self._write(entry)
+            return response
+        return record
+
+
+class ReplayTransport():
+    """
+        Feeds recorded ZTE modem API responses back into a REST session.
+
+        Responses are served in recorded order for each request key,
+        once exhausted the last response for that key is repeated.
+        The recorded round trip time is reproduced, multiplied by "latency_scale",
+        pass 0 to replay without delay. Recorded errors are raised again as the
+        matching "requests.exceptions" class, or "ReplayError" for other exceptions.
+    """
+
+    def __init__(self, path: str, latency_scale: float=1.0) -> None:
+        self._path = path
+        self._latency_scale = latency_scale
+        self._lock = Lock()
+        self._entries = defaultdict(deque)
+        self._last = {}
+        with _open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry['k']].append(entry)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def latency_scale(self) -> float:
+        return self._latency_scale
+
+    @latency_scale.setter
+    def latency_scale(self, value: float):
+        self._latency_scale = value
+
+    def _next_entry(self, key: str) -> dict:
+        with self._lock:
+            entries = self._entries.get(key)
+            if entries:
+                self._last[key] = entries.popleft()
+            if key not in self._last:
+                raise ReplayError(f'No recorded response for "{key}" in {self.path}!')
+            return self._last[key]
+
+    def _build_error(self, entry: dict) -> Exception:
+        """ Rebuild a recorded exception, falling back to "ReplayError" for unknown names. """
+        message = f'Recorded {entry["e"]} for "{entry["k"]}".'
+        if entry['e'] == 'timeout':
+            # Recordings made before exception names were stored
+            return Timeout(message)
+        error = getattr(exceptions, entry['e'], None)
+        if isinstance(error, type) and issubclass(error, Exception):
+            return error(message)
+        return ReplayError(message)
+
+    def wrap(self, method: str, func):
+        """
+            Replace a request method with one serving recorded responses.
+
+            Arguments:
+                method:
+                    Request method being replaced, either "GET" or "POST".
+                func:
+                    Request callable, unused.
+            Returns:
+                Callable with the same signature as "func".
+            Raises:
+                ReplayError: If no response was recorded for a request.
+        """
+        def replay(url: str, data: dict=None, **kwargs):
+            entry = self._next_entry(_request_key(method=method, url=url, data=data))
+            if self.latency_scale:
+                time.sleep(entry.get('d', 0) * self.latency_scale)
+            if 'e' in entry:
+                raise self._build_error(entry=entry)
+            return ReplayResponse(payload=entry.get('r', {}))
+        return replay
@@ -0,0 +1,117 @@
+from threading import Event, Thread
+from .models import Connection
+import time
+
+
+class ReconnectWatchdog():
+    """
+        Monitors the ZTE modem WAN connection and reconnects it when dropped.
+
+        Time to reconnect is measured from the moment a dropped connection is
+        detected until the modem reports "ipv4_ipv6_connected" again.
+        Errors raised while checking, e.g. network errors while the link is down,
+        are reported through "on_error" and "last_error" without stopping the watchdog.
+    """
+
+    def __init__(self, connection: Connection, interval: float=10, timeout: float=60, on_reconnect=None, on_error=None) -> None:
+        self._connection = connection
+        self._interval = interval
+        self._timeout = timeout
+        self._on_reconnect = on_reconnect
+        self._on_error = on_error
+        self._last_error = None
+        self._reconnect_times = []
+        self._stop = Event()
+        self._thread = None
+
+    @property
+    def connection(self) -> Connection:
+        return self._connection
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: float):
+        self._interval = value
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float):
+        self._timeout = value
+
+    @property
+    def reconnect_times(self) -> list:
+        """ List: Measured time to reconnect for each recovered drop, in seconds. """
+        return list(self._reconnect_times)
+
+    @property
+    def last_reconnect_time(self) -> float:
+        """ Numeric: Measured time to reconnect for the last recovered drop, in seconds. """
+        return self._reconnect_times[-1] if self._reconnect_times else None
+
+    @property
+    def last_error(self) -> Exception:
+        """ Exception: Last error raised while checking the connection in the background thread. """
+        return self._last_error
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def check(self) -> float:
+        """
+            Check the connection state once, reconnecting if it has dropped.
+
+            Only "ppp_disconnected" and "ppp_connecting" are treated as dropped,
+            consistent with "Connection.is_connected".
+
+            Returns:
+                Seconds taken to reconnect, 0 if not dropped, None if reconnection timed out.
+        """
+        state = self.connection.poll_state()
+        if state not in (self.connection.DISCONNECTED_STATE, self.connection.CONNECTING_STATE):
+            return 0
+
+        start = time.monotonic()
+        if state == self.connection.CONNECTING_STATE:
+            reached = self.connection.wait_for_state(state=self.connection.CONNECTED_STATE, timeout=self.timeout) is not None
+        else:
+            reached = self.connection.connect(wait=True, timeout=self.timeout)
+        if not reached:
+            return None
+
+        elapsed = time.monotonic() - start
+        self._reconnect_times.append(elapsed)
+        if self._on_reconnect:
+            self._on_reconnect(elapsed)
+        return elapsed
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                self._last_error = e
+                if self._on_error:
+                    self._on_error(e)
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """ Start monitoring the connection in a background thread. """
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name='ReconnectWatchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float=None):
+        """ Stop monitoring the connection, waiting for the background thread to exit. """
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,204 @@
+from urllib.parse import urlparse, parse_qs
+from requests import ConnectionError
+from pyzte5g import RESTCore, RESTSession, ZTE_Client, cli
+from pyzte5g.models import Connection
+import json
+import pytest
+
+
+URL = 'http://192.0.2.1/'
+RESPONSE = {
+    'ppp_status': 'ipv4_ipv6_connected',
+    'lte_rsrp': '-95',
+    'Z5g_rsrp': '-88',
+    'datausage_usedamount': '1073741824',
+    'hardware_version': 'MC801A',
+}
+
+
+class FakeResponse():
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def json(self) -> dict:
+        return dict(self._payload)
+
+
+class FakeClock():
+    """ Stands in for the "time" module, sleeping advances the clock instantly. """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeCore(RESTCore):
+    """ RESTCore serving "RESPONSE" values and recording every request. """
+
+    def __init__(self, response: dict=RESPONSE, **kwargs) -> None:
+        super().__init__(url=URL)
+        self.response = response
+        self.queried = []
+        self.posted = []
+        self.on_get = None
+
+    def _method_request_get(self):
+        def get(url, **kwargs):
+            cmd = parse_qs(urlparse(url).query)['cmd'][0].split(',')
+            self.queried.append(cmd)
+            if self.on_get:
+                self.on_get()
+            return FakeResponse({key: self.response.get(key, '') for key in cmd})
+        return get
+
+    def _method_request_post(self):
+        def post(url, data=None, **kwargs):
+            self.posted.append(data)
+            return FakeResponse({'result': 'success'})
+        return post
+
+
+@pytest.fixture(autouse=True)
+def clear_process_cache():
+    RESTCore.GET_PROCESS_CACHE.clear()
+    yield
+    RESTCore.GET_PROCESS_CACHE.clear()
+
+
+@pytest.fixture
+def core(monkeypatch):
+    core = FakeCore()
+    monkeypatch.setattr(cli, 'RESTCore', lambda **kwargs: core)
+    return core
+
+
+def output_lines(capsys) -> list:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_query_evaluates_properties_in_one_request(core, capsys):
+    assert cli.main(['query', 'ppp_status', 'connection.is_connected', 'datausage.used_data']) == 0
+    assert output_lines(capsys) == [{
+        'ppp_status': 'ipv4_ipv6_connected',
+        'connection.is_connected': True,
+        'datausage.used_data': '1.0 GB',
+    }]
+    assert len(core.queried) == 1
+    assert set(Connection.CONNECTION_CMDS) <= set(core.queried[0])
+
+
+def test_query_expands_whole_model(core, capsys):
+    assert cli.main(['query', 'connection']) == 0
+    result = output_lines(capsys)[0]
+    assert list(result) == [f'connection.{prop}' for prop in Connection.CONNECTION_PROPERTIES]
+    assert result['connection.state'] == 'ipv4_ipv6_connected'
+    assert result['connection.sig_strength_5g'] == -88
+    # Missing private values are hidden while the session is not authenticated
+    assert result['connection.wan_ipv4_addr'] is None
+
+
+@pytest.mark.parametrize('field', ['connection.transition_time', 'connection.cache_ttl', 'datausage.nope'])
+def test_query_rejects_unknown_properties(core, capsys, field):
+    assert cli.main(['query', field]) == 2
+    assert 'is not a queryable property' in capsys.readouterr().err
+    assert core.queried == []
+
+
+def test_get_passthrough(core, capsys):
+    assert cli.main(['get', 'ppp_status', 'lte_rsrp']) == 0
+    assert output_lines(capsys) == [{'ppp_status': 'ipv4_ipv6_connected', 'lte_rsrp': '-95'}]
+
+
+def test_set_parses_key_value_pairs(core, capsys):
+    assert cli.main(['set', 'goformId=CONNECT_NETWORK', 'note=a=b']) == 0
+    assert output_lines(capsys) == [{'result': True}]
+    assert core.posted == [{'goformId': 'CONNECT_NETWORK', 'note': 'a=b'}]
+
+    assert cli.main(['set', 'goformId']) == 2
+    assert 'KEY=VALUE' in capsys.readouterr().err
+    assert len(core.posted) == 1
+
+
+def test_request_errors_are_reported(core, capsys):
+    def refuse():
+        raise ConnectionError('refused')
+
+    core.on_get = refuse
+    assert cli.main(['query', 'ppp_status']) == 1
+    assert capsys.readouterr().err.startswith('pyzte5g: error: ConnectionError')
+
+
+@pytest.mark.parametrize('interval', ['0', '-1', 'soon'])
+def test_watch_rejects_invalid_interval(core, interval):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(['watch', '--interval', interval, 'ppp_status'])
+    assert exc.value.code == 2
+
+
+def test_watch_skips_missed_ticks(core, capsys, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cli, 'time', clock)
+
+    def stall():
+        # The second query stalls for 2.5 intervals
+        if len(core.queried) == 2:
+            clock.now += 2.5
+
+    core.on_get = stall
+    assert cli.main(['watch', '--interval', '1', '--count', '4', 'ppp_status', 'connection.state']) == 0
+    lines = output_lines(capsys)
+    assert [line['ts'] for line in lines] == [0, 1, 4, 5]
+    assert all(line['connection.state'] == 'ipv4_ipv6_connected' for line in lines)
+    assert len(core.queried) == 4
+
+
+class ProbeSession(RESTSession):
+    """ RESTSession serving "RESPONSE" values, counting every request. """
+
+    def __init__(self, authenticated: bool) -> None:
+        super().__init__(url=URL, password=None)
+        self.authenticated = authenticated
+        self.queried = []
+        self.renewed = 0
+
+    def _method_request_get(self):
+        def get(url, **kwargs):
+            cmd = parse_qs(urlparse(url).query)['cmd'][0].split(',')
+            self.queried.append(cmd)
+            if not self.authenticated:
+                return FakeResponse({key: (RESPONSE[key] if key == 'ppp_status' else '') for key in cmd})
+            return FakeResponse({key: RESPONSE.get(key, '') for key in cmd})
+        return get
+
+    def _renew_auth(self):
+        self.renewed += 1
+        self.authenticated = True
+        return True
+
+
+def test_fetch_probes_auth_at_most_once():
+    session = ProbeSession(authenticated=True)
+    query = cli.FieldQuery(client=ZTE_Client(url=URL, session=session), fields=['connection.state', 'connection.sig_strength_5g'])
+    assert query.fetch() == {'connection.state': 'ipv4_ipv6_connected', 'connection.sig_strength_5g': -88}
+    assert len(session.queried) == 1
+
+    session = ProbeSession(authenticated=False)
+    query = cli.FieldQuery(client=ZTE_Client(url=URL, session=session), fields=['connection'])
+    assert query.fetch()['connection.sig_strength_lte'] is None
+    # One merged query plus a single authentication probe
+    assert [cmd[0] for cmd in session.queried] == ['ppp_status', 'hardware_version']
+
+    # The expired session is renewed on the following query
+    assert query.fetch()['connection.sig_strength_lte'] == -95
+    assert session.renewed == 1
@@ -0,0 +1,169 @@
+from urllib.parse import urlparse, parse_qs
+from pyzte5g import RESTCore, RESTSession, ReconnectWatchdog
+from pyzte5g.models import Connection
+import pyzte5g.models.connection, pyzte5g.watchdog
+import time
+import pytest
+
+
+URL = 'http://192.0.2.1/'
+
+
+class FakeClock():
+    """ Stands in for the "time" module, sleeping advances the clock instantly. """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ScriptedSession():
+    """ Session serving "ppp_status" values in order, repeating the last one. """
+
+    def __init__(self, states: list) -> None:
+        self.states = list(states)
+        self.polls = []
+        self.sets = []
+
+    def fetch_cmd_process(self, cmd: tuple, authenticate: bool=True) -> dict:
+        self.polls.append((cmd, authenticate))
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if isinstance(state, Exception):
+            raise state
+        return {'ppp_status': state}
+
+    def set_cmd_process(self, data: dict) -> bool:
+        self.sets.append(data['goformId'])
+        return True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(pyzte5g.models.connection, 'time', clock)
+    monkeypatch.setattr(pyzte5g.watchdog, 'time', clock)
+    return clock
+
+
+def test_wait_for_state_backs_off(clock):
+    session = ScriptedSession(['ppp_connecting'] * 5 + ['ipv4_ipv6_connected'])
+    elapsed = Connection(session=session).wait_for_state(state='ipv4_ipv6_connected')
+
+    assert clock.sleeps == pytest.approx([0.1, 0.15, 0.225, 0.3375, 0.50625])
+    assert elapsed == pytest.approx(sum(clock.sleeps))
+    # Only the state is polled, without session authentication checks
+    assert session.polls == [(('ppp_status',), False)] * 6
+
+
+def test_wait_for_state_times_out(clock):
+    session = ScriptedSession(['ppp_connecting'])
+    elapsed = Connection(session=session).wait_for_state(state='ipv4_ipv6_connected', timeout=10, poll_max=2)
+
+    assert elapsed is None
+    assert clock.now == pytest.approx(10)
+    assert max(clock.sleeps) == pytest.approx(2)
+
+
+def test_connect_waits_for_connected_state(clock):
+    session = ScriptedSession(['ppp_connecting', 'ipv4_ipv6_connected'])
+    connection = Connection(session=session)
+    assert connection.connect(wait=True)
+    assert session.sets == ['CONNECT_NETWORK']
+    assert connection.transition_time == pytest.approx(0.1)
+
+    session = ScriptedSession(['ipv4_ipv6_connected'])
+    connection = Connection(session=session)
+    assert not connection.disconnect(wait=True, timeout=1)
+    assert connection.transition_time is None
+
+
+@pytest.mark.parametrize('state', ['ipv4_ipv6_connected', 'ipv4_connected', 'ipv6_connected', ''])
+def test_watchdog_ignores_connected_states(clock, state):
+    session = ScriptedSession([state])
+    assert ReconnectWatchdog(Connection(session=session)).check() == 0
+    assert session.sets == []
+
+
+def test_watchdog_reconnects_dropped_link(clock):
+    session = ScriptedSession(['ppp_disconnected', 'ppp_connecting', 'ipv4_ipv6_connected'])
+    times = []
+    watchdog = ReconnectWatchdog(Connection(session=session), on_reconnect=times.append)
+
+    assert watchdog.check() == pytest.approx(0.1)
+    assert session.sets == ['CONNECT_NETWORK']
+    assert watchdog.reconnect_times == times == [pytest.approx(0.1)]
+
+    session = ScriptedSession(['ppp_connecting', 'ppp_connecting', 'ipv4_ipv6_connected'])
+    watchdog = ReconnectWatchdog(Connection(session=session))
+    assert watchdog.check() == pytest.approx(0.1)
+    assert session.sets == []
+
+
+def test_watchdog_survives_errors():
+    session = ScriptedSession([ConnectionError('link down')])
+    errors = []
+    watchdog = ReconnectWatchdog(Connection(session=session), interval=0.01, on_error=errors.append)
+    watchdog.start()
+    try:
+        time.sleep(0.1)
+        assert watchdog.is_running
+        assert isinstance(watchdog.last_error, ConnectionError)
+        assert len(errors) > 1
+    finally:
+        watchdog.stop()
+    assert not watchdog.is_running
+
+
+class FakeResponse():
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def json(self) -> dict:
+        return dict(self._payload)
+
+
+class ScriptedRESTSession(RESTSession):
+    """ RESTSession answering GET requests from scripted "ppp_status" values. """
+
+    def __init__(self, states: list) -> None:
+        super().__init__(url=URL, password=None)
+        self.states = list(states)
+        self.queried = []
+        self.renewed = 0
+
+    def _method_request_get(self):
+        def get(url, **kwargs):
+            cmd = parse_qs(urlparse(url).query)['cmd'][0]
+            self.queried.append(cmd)
+            if cmd == 'hardware_version':
+                return FakeResponse({'hardware_version': 'MC801A'})
+            return FakeResponse({'ppp_status': self.states.pop(0)})
+        return get
+
+    def _renew_auth(self):
+        self.renewed += 1
+        return True
+
+
+def test_poll_state_skips_auth_probes():
+    RESTCore.GET_PROCESS_CACHE.clear()
+    session = ScriptedRESTSession(['ipv4_ipv6_connected'])
+    assert Connection(session=session).poll_state() == 'ipv4_ipv6_connected'
+    assert session.queried == ['ppp_status']
+    assert session.renewed == 0
+
+
+def test_poll_state_renews_auth_on_empty_response():
+    RESTCore.GET_PROCESS_CACHE.clear()
+    session = ScriptedRESTSession(['', 'ipv4_ipv6_connected'])
+    assert Connection(session=session).poll_state() == 'ipv4_ipv6_connected'
+    assert session.queried == ['ppp_status', 'ppp_status']
+    assert session.renewed == 1
@@ -0,0 +1,80 @@
+from pyzte5g import FleetFrame, RESTCore, ZTE_Client
+import pyzte5g.fleet
+import subprocess, sys
+import pytest
+
+
+RECORDS = {
+    'a': {'state': 'ipv4_ipv6_connected', 'sig_strength_5g': -80, 'used_bytes': 100},
+    'b': {'state': 'ipv4_ipv6_connected', 'sig_strength_5g': -110, 'used_bytes': 300},
+    'c': {'state': 'ppp_disconnected', 'sig_strength_5g': -95, 'used_bytes': 200},
+    'd': {'state': 'ppp_disconnected', 'used_bytes': 400},
+}
+
+
+@pytest.fixture(params=['numpy', 'stdlib'])
+def frame(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(pyzte5g.fleet, '_numpy', lambda: None)
+    return FleetFrame.from_records(RECORDS, timestamp=0)
+
+
+def test_aggregate_skips_missing(frame):
+    assert frame.mask('sig_strength_5g') == bytearray([1, 1, 1, 0])
+    assert frame.aggregate('sig_strength_5g') == {
+        'count': 3, 'min': -110, 'max': -80, 'mean': -95, 'median': -95,
+    }
+    assert frame.aggregate('wan_ipv4_addr', funcs=('count', 'mean')) == {'count': 0, 'mean': None}
+
+
+def test_percentiles_interpolate(frame):
+    assert frame.percentiles('used_bytes', q=(0, 50, 99.9, 100)) == pytest.approx(
+        {0: 100, 50: 250, 99.9: 399.7, 100: 400}
+    )
+    with pytest.raises(ValueError):
+        frame.percentiles('used_bytes', q=(101,))
+
+
+def test_group_by_and_top_k(frame):
+    assert frame.group_by('state', 'used_bytes', func='sum') == {
+        'ipv4_ipv6_connected': 400, 'ppp_disconnected': 600,
+    }
+    assert frame.top_k('sig_strength_5g', k=2, largest=False) == [('b', -110), ('c', -95)]
+    assert frame.top_k('used_bytes', k=1) == [('d', 400)]
+
+
+def test_top_k_ties_keep_row_order(frame):
+    for modem_id in 'efgh':
+        frame.append(modem_id=modem_id, record={'used_bytes': 300, 'sig_strength_5g': -110}, timestamp=0)
+    assert frame.top_k('used_bytes', k=4) == [('d', 400), ('b', 300), ('e', 300), ('f', 300)]
+    assert frame.top_k('sig_strength_5g', k=3, largest=False) == [('b', -110), ('e', -110), ('f', -110)]
+    assert frame.top_k('state', k=2, largest=False) == [('a', 'ipv4_ipv6_connected'), ('b', 'ipv4_ipv6_connected')]
+
+
+def test_rejected_append_leaves_frame_unchanged(frame):
+    with pytest.raises(TypeError, match='used_bytes'):
+        frame.append(modem_id='e', record={'sig_strength_5g': -90, 'used_bytes': 1.5}, timestamp=0)
+    with pytest.raises(TypeError, match='timestamp'):
+        frame.append(modem_id='e', record={}, timestamp='now')
+    assert frame.ids == list(RECORDS)
+    assert len(frame.timestamps) == 4
+    assert all(len(frame.column(name)) == len(frame.mask(name)) == 4 for name in frame.fields)
+    assert frame.aggregate('sig_strength_5g', funcs=('count',)) == {'count': 3}
+
+
+def test_import_does_not_load_numpy():
+    script = 'import pyzte5g, pyzte5g.cli, pyzte5g.fleet, sys; assert "numpy" not in sys.modules'
+    subprocess.run([sys.executable, '-c', script], check=True)
+
+
+def test_collect_records_errors():
+    class FailingCore(RESTCore):
+        def get_cmd_process(self, cmd):
+            raise ConnectionError('unreachable')
+
+    frame = FleetFrame.collect({'down': ZTE_Client(url='http://192.0.2.1/', session=FailingCore(url='http://192.0.2.1/'))})
+    assert frame.ids == ['down']
+    assert isinstance(frame.errors['down'], ConnectionError)
+    assert frame.mask('state') == bytearray([0])
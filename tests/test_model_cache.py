@@ -0,0 +1,92 @@
+from threading import Lock, Thread
+from pyzte5g import RESTCore, ZTE_Client
+import gc, time, weakref
+import pytest
+
+
+THREADS = 32
+READS = 200
+RESPONSE = {
+    'ppp_status': 'ipv4_ipv6_connected',
+    'datausage_usedamount': '1073741824',
+}
+
+
+class FakeResponse():
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def json(self) -> dict:
+        return dict(self._payload)
+
+
+class CountingCore(RESTCore):
+    """ RESTCore counting GET requests instead of sending them. """
+
+    def __init__(self, url: str='http://192.0.2.1/') -> None:
+        super().__init__(url=url)
+        self.calls = 0
+        self._calls_lock = Lock()
+
+    def _method_request_get(self):
+        def get(url, **kwargs):
+            with self._calls_lock:
+                self.calls += 1
+            time.sleep(0.001)
+            return FakeResponse(RESPONSE)
+        return get
+
+
+@pytest.fixture(autouse=True)
+def clear_process_cache():
+    RESTCore.GET_PROCESS_CACHE.clear()
+    yield
+    RESTCore.GET_PROCESS_CACHE.clear()
+
+
+def test_concurrent_reads_are_bounded():
+    session = CountingCore()
+    client = ZTE_Client(url=session.baseurl, session=session, cache_ttl=60)
+    errors = []
+
+    def read():
+        try:
+            for _ in range(READS):
+                assert client.connection.state == 'ipv4_ipv6_connected'
+                assert client.datausage.used_bytes == 1073741824
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=read) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    # Concurrent misses wait for the first request, one query per model
+    assert session.calls == 2
+
+
+def test_model_caches_are_per_instance():
+    first, second = CountingCore(), CountingCore()
+    ZTE_Client(url=first.baseurl, session=first).datausage.used_bytes
+    ZTE_Client(url=second.baseurl, session=second).datausage.used_bytes
+    assert first.calls == 1
+    assert second.calls == 1
+
+
+def test_session_swap_releases_old_session():
+    session = CountingCore()
+    client = ZTE_Client(url=session.baseurl, session=session, cache_ttl=60)
+    assert client.connection.state == 'ipv4_ipv6_connected'
+    assert client.datausage.used_bytes == 1073741824
+    ref = weakref.ref(session)
+    del session
+
+    client.session = CountingCore()
+    gc.collect()
+    assert ref() is None
+    assert client.connection.state == 'ipv4_ipv6_connected'
+    assert client.session.calls == 1
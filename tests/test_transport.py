@@ -0,0 +1,122 @@
+from requests import ConnectionError, Timeout
+from pyzte5g import RESTCore, RESTSession, ZTE_Client, RecordTransport, ReplayTransport
+from pyzte5g.exceptions import ReplayError
+import pyzte5g.transport
+import gzip, json
+import pytest
+
+
+URL = 'http://192.0.2.1/'
+STATE_KEY = 'GET goform/goform_get_cmd_process?cmd=ppp_status'
+
+
+class FakeResponse():
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def json(self) -> dict:
+        return dict(self._payload)
+
+
+class ScriptedCore(RESTCore):
+    """ RESTCore answering GET requests from a scripted list of payloads or exceptions. """
+
+    def __init__(self, script: list, transport=None) -> None:
+        super().__init__(url=URL, retries=1, transport=transport)
+        self._script = list(script)
+
+    def _method_request_get(self):
+        def get(url, **kwargs):
+            step = self._script.pop(0)
+            if isinstance(step, Exception):
+                raise step
+            return FakeResponse(step)
+        return get
+
+
+def write_recording(path, entries: list):
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+
+
+@pytest.fixture(autouse=True)
+def clear_process_cache():
+    RESTCore.GET_PROCESS_CACHE.clear()
+    yield
+    RESTCore.GET_PROCESS_CACHE.clear()
+
+
+def test_record_replay_round_trip_gzip(tmp_path):
+    path = str(tmp_path / 'session.jsonl.gz')
+    with RecordTransport(path) as recorder:
+        core = ScriptedCore([{'ppp_status': 'ppp_connecting'}, {'ppp_status': 'ipv4_ipv6_connected'}], transport=recorder)
+        assert core.fetch_cmd_process(cmd=('ppp_status',)) == {'ppp_status': 'ppp_connecting'}
+        assert core.fetch_cmd_process(cmd=('ppp_status',)) == {'ppp_status': 'ipv4_ipv6_connected'}
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    assert [entry['k'] for entry in entries] == [STATE_KEY, STATE_KEY]
+    assert all('d' in entry and 't' in entry for entry in entries)
+
+    core = RESTCore(url=URL, transport=ReplayTransport(path, latency_scale=0))
+    assert core.fetch_cmd_process(cmd=('ppp_status',)) == {'ppp_status': 'ppp_connecting'}
+    assert core.fetch_cmd_process(cmd=('ppp_status',)) == {'ppp_status': 'ipv4_ipv6_connected'}
+    # Exhausted keys repeat their last response
+    assert core.fetch_cmd_process(cmd=('ppp_status',)) == {'ppp_status': 'ipv4_ipv6_connected'}
+
+
+def test_replay_scales_latency(tmp_path, monkeypatch):
+    path = str(tmp_path / 'session.jsonl')
+    write_recording(path, [{'t': 0, 'k': STATE_KEY, 'd': 0.2, 'r': {'ppp_status': 'ppp_connecting'}}])
+    sleeps = []
+    monkeypatch.setattr(pyzte5g.transport.time, 'sleep', sleeps.append)
+
+    replay = ReplayTransport(path, latency_scale=0.5)
+    core = RESTCore(url=URL, transport=replay)
+    core.fetch_cmd_process(cmd=('ppp_status',))
+    replay.latency_scale = 0
+    core.fetch_cmd_process(cmd=('ppp_status',))
+    assert sleeps == [pytest.approx(0.1)]
+
+
+def test_replay_raises_recorded_errors(tmp_path):
+    path = str(tmp_path / 'session.jsonl')
+    with RecordTransport(path) as recorder:
+        core = ScriptedCore([ConnectionError('refused')], transport=recorder)
+        with pytest.raises(ConnectionError):
+            core.fetch_cmd_process(cmd=('ppp_status',))
+    assert json.loads(open(path).readline())['e'] == 'ConnectionError'
+
+    write_recording(path, [
+        {'t': 0, 'k': STATE_KEY, 'd': 0, 'e': 'ConnectionError'},
+        # One retry on timeout, so the timeout is recorded twice
+        {'t': 0, 'k': STATE_KEY, 'd': 0, 'e': 'ReadTimeout'},
+        {'t': 0, 'k': STATE_KEY, 'd': 0, 'e': 'ReadTimeout'},
+        {'t': 0, 'k': STATE_KEY, 'd': 0, 'e': 'KeyError'},
+    ])
+    core = RESTCore(url=URL, retries=1, transport=ReplayTransport(path, latency_scale=0))
+    with pytest.raises(ConnectionError):
+        core.fetch_cmd_process(cmd=('ppp_status',))
+    with pytest.raises(Timeout):
+        core.fetch_cmd_process(cmd=('ppp_status',))
+    with pytest.raises(ReplayError):
+        core.fetch_cmd_process(cmd=('ppp_status',))
+    with pytest.raises(ReplayError):
+        core.fetch_cmd_process(cmd=('lte_rsrp',))
+
+
+def test_replay_sets_state_without_browser(tmp_path):
+    path = str(tmp_path / 'session.jsonl')
+    write_recording(path, [
+        {'t': 0, 'k': 'POST goform/goform_set_cmd_process#CONNECT_NETWORK', 'd': 0, 'r': {'result': 'success'}},
+        {'t': 0, 'k': 'GET goform/goform_get_cmd_process?cmd=hardware_version', 'd': 0, 'r': {'hardware_version': 'MC801A'}},
+    ])
+
+    def webdriver(**kwargs):
+        raise AssertionError('Webdriver started while replaying')
+
+    session = RESTSession(url=URL, password=None, transport=ReplayTransport(path, latency_scale=0))
+    session.webdriver = webdriver
+    assert ZTE_Client(url=URL, session=session).connection.connect()